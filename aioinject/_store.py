@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-import collections
 import contextlib
 import enum
 import threading
 import typing
-from collections.abc import AsyncIterator, Iterator
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Final, Literal, TypeVar
 
 import anyio
 
-from aioinject._utils import enter_context_maybe, enter_sync_context_maybe
+from aioinject._utils import (
+    ContextManagerKind,
+    enter_context_maybe,
+    enter_sync_context_maybe,
+)
 from aioinject.providers import DependencyLifetime
 
 
@@ -28,18 +30,32 @@ class NotInCache(enum.Enum):
     sentinel = enum.auto()
 
 
+# Plain global lookup, NotInCache.sentinel goes through enum's attribute access
+NOT_IN_CACHE: Final = NotInCache.sentinel
+
+
+# nullcontext is stateless and both a sync and an async context manager
+_SHOULD_PROVIDE = contextlib.nullcontext(True)  # noqa: FBT003
+_CACHED = contextlib.nullcontext(False)  # noqa: FBT003
+
+
 class InstanceStore:
+    __slots__ = ("_cache", "_exit_stack", "_sync_exit_stack")
+
     def __init__(
         self,
         exit_stack: contextlib.AsyncExitStack | None = None,
         sync_exit_stack: contextlib.ExitStack | None = None,
     ) -> None:
         self._cache: dict[Provider[Any], Any] = {}
-        self._exit_stack = exit_stack or contextlib.AsyncExitStack()
-        self._sync_exit_stack = sync_exit_stack or contextlib.ExitStack()
+        # Exit stacks are created on first use, most scopes never need them
+        self._exit_stack = exit_stack
+        self._sync_exit_stack = sync_exit_stack
 
     def get(self, provider: Provider[T]) -> T | Literal[NotInCache.sentinel]:
-        return self._cache.get(provider, NotInCache.sentinel)
+        # Transients are never stored, a try/except KeyError would make
+        # every miss pay for raising
+        return self._cache.get(provider, NOT_IN_CACHE)
 
     def add(self, provider: Provider[T], obj: T) -> None:
         if provider.lifetime is not DependencyLifetime.transient:
@@ -49,40 +65,59 @@ class InstanceStore:
         self,
         provider: Provider[Any],
     ) -> AbstractAsyncContextManager[bool]:
-        return contextlib.nullcontext(provider not in self._cache)
+        return _SHOULD_PROVIDE if provider not in self._cache else _CACHED
 
     def sync_lock(
         self,
         provider: Provider[Any],
     ) -> AbstractContextManager[bool]:
-        return contextlib.nullcontext(provider not in self._cache)
+        return _SHOULD_PROVIDE if provider not in self._cache else _CACHED
 
     @typing.overload
     async def enter_context(
         self,
         obj: AbstractAsyncContextManager[T] | AbstractContextManager[T],
+        kind: ContextManagerKind | None = None,
     ) -> T: ...
 
     @typing.overload
-    async def enter_context(self, obj: T) -> T: ...
+    async def enter_context(
+        self,
+        obj: T,
+        kind: ContextManagerKind | None = None,
+    ) -> T: ...
 
     async def enter_context(
         self,
         obj: AbstractAsyncContextManager[T] | AbstractContextManager[T] | T,
+        kind: ContextManagerKind | None = None,
     ) -> T:
-        return await enter_context_maybe(obj, self._exit_stack)
+        if self._exit_stack is None:
+            self._exit_stack = contextlib.AsyncExitStack()
+        return await enter_context_maybe(obj, self._exit_stack, kind)
 
     @typing.overload
-    def enter_sync_context(self, obj: AbstractContextManager[T]) -> T: ...
+    def enter_sync_context(
+        self,
+        obj: AbstractContextManager[T],
+        kind: ContextManagerKind | None = None,
+    ) -> T: ...
 
     @typing.overload
-    def enter_sync_context(self, obj: T) -> T: ...
+    def enter_sync_context(
+        self,
+        obj: T,
+        kind: ContextManagerKind | None = None,
+    ) -> T: ...
 
     def enter_sync_context(
         self,
         obj: AbstractContextManager[T] | T,
+        kind: ContextManagerKind | None = None,
     ) -> T:
-        return enter_sync_context_maybe(obj, self._sync_exit_stack)
+        if self._sync_exit_stack is None:
+            self._sync_exit_stack = contextlib.ExitStack()
+        return enter_sync_context_maybe(obj, self._sync_exit_stack, kind)
 
     async def __aenter__(self) -> Self:
         return self  # pragma: no cover
@@ -93,7 +128,8 @@ class InstanceStore:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
+        if self._exit_stack is not None:
+            await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
 
     async def aclose(self) -> None:
         await self.__aexit__(None, None, None)
@@ -107,43 +143,112 @@ class InstanceStore:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        self._sync_exit_stack.__exit__(exc_type, exc_val, exc_tb)
+        if self._sync_exit_stack is not None:
+            self._sync_exit_stack.__exit__(exc_type, exc_val, exc_tb)
 
     def close(self) -> None:
         self.__exit__(None, None, None)
 
 
 class SingletonStore(InstanceStore):
+    __slots__ = ("_locks", "_sync_locks")
+
     def __init__(
         self,
         exit_stack: contextlib.AsyncExitStack | None = None,
         sync_exit_stack: contextlib.ExitStack | None = None,
     ) -> None:
-        super().__init__(exit_stack, sync_exit_stack)
-        self._locks: dict[Provider[Any], anyio.Lock] = collections.defaultdict(
-            anyio.Lock,
-        )
-        self._sync_locks: dict[Provider[Any], threading.Lock] = (
-            collections.defaultdict(
-                threading.Lock,
-            )
+        # Singletons can be entered from several threads at once, so unlike
+        # per-scope stores the exit stacks are created upfront
+        super().__init__(
+            exit_stack or contextlib.AsyncExitStack(),
+            sync_exit_stack or contextlib.ExitStack(),
         )
+        self._locks: dict[Provider[Any], anyio.Lock] = {}
+        self._sync_locks: dict[Provider[Any], threading.Lock] = {}
 
-    @contextlib.asynccontextmanager
-    async def lock(self, provider: Provider[Any]) -> AsyncIterator[bool]:
-        if provider not in self._cache:
-            async with self._locks[provider]:
-                yield provider not in self._cache
-                return
-        yield False
+    def lock(
+        self,
+        provider: Provider[Any],
+    ) -> AbstractAsyncContextManager[bool]:
+        return _SingletonLock(self._cache, self._locks, provider)
 
-    @contextlib.contextmanager
     def sync_lock(
         self,
         provider: Provider[Any],
-    ) -> Iterator[bool]:
-        if provider not in self._cache:
-            with self._sync_locks[provider]:
-                yield provider not in self._cache
-                return
-        yield False
+    ) -> AbstractContextManager[bool]:
+        return _SyncSingletonLock(self._cache, self._sync_locks, provider)
+
+
+class _SingletonLock:
+    __slots__ = ("_acquired", "_cache", "_locks", "_provider")
+
+    def __init__(
+        self,
+        cache: dict[Provider[Any], Any],
+        locks: dict[Provider[Any], anyio.Lock],
+        provider: Provider[Any],
+    ) -> None:
+        self._cache = cache
+        self._locks = locks
+        self._provider = provider
+        self._acquired: anyio.Lock | None = None
+
+    async def __aenter__(self) -> bool:
+        cache, provider = self._cache, self._provider
+        if provider in cache:
+            return False
+
+        lock = self._locks.get(provider)
+        if lock is None:
+            lock = self._locks.setdefault(provider, anyio.Lock())
+        await lock.acquire()
+        self._acquired = lock
+        return provider not in cache
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._acquired is not None:
+            self._acquired.release()
+            self._acquired = None
+
+
+class _SyncSingletonLock:
+    __slots__ = ("_acquired", "_cache", "_locks", "_provider")
+
+    def __init__(
+        self,
+        cache: dict[Provider[Any], Any],
+        locks: dict[Provider[Any], threading.Lock],
+        provider: Provider[Any],
+    ) -> None:
+        self._cache = cache
+        self._locks = locks
+        self._provider = provider
+        self._acquired: threading.Lock | None = None
+
+    def __enter__(self) -> bool:
+        cache, provider = self._cache, self._provider
+        if provider in cache:
+            return False
+
+        lock = self._locks.get(provider)
+        if lock is None:
+            lock = self._locks.setdefault(provider, threading.Lock())
+        lock.acquire()
+        self._acquired = lock
+        return provider not in cache
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._acquired is not None:
+            self._acquired.release()
+            self._acquired = None
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import collections.abc
 import contextlib
+import enum
 import functools
 import inspect
 import sys
+import types
 import typing
 from collections.abc import Callable, Iterator
 from contextlib import (
@@ -13,7 +15,7 @@ from contextlib import (
     AsyncExitStack,
     ExitStack,
 )
-from typing import Any, TypeVar
+from typing import Annotated, Any, TypeVar
 
 from aioinject.markers import Inject
 
@@ -43,26 +45,36 @@ def clear_wrapper(wrapper: _F) -> _F:
 def get_inject_annotations(
     function: Callable[..., Any],
 ) -> dict[str, Any]:
+    result: dict[str, Any] = {}
     with remove_annotation(function.__annotations__, "return"):
-        return {
-            name: annotation
-            for name, annotation in typing.get_type_hints(
-                function,
-                include_extras=True,
-            ).items()
-            if any(
-                isinstance(arg, Inject) or arg is Inject
-                for arg in typing.get_args(annotation)
-            )
-        }
+        hints = typing.get_type_hints(function, include_extras=True)
+    for name, annotation in hints.items():
+        if typing.get_origin(annotation) is not Annotated:
+            continue
+        for arg in annotation.__metadata__:
+            if isinstance(arg, Inject) or arg is Inject:
+                result[name] = annotation
+                break
+    return result
+
+
+class ContextManagerKind(enum.IntEnum):
+    none = 0
+    sync = 1
+    async_ = 2
+
+
+def get_context_manager_kind(func: Callable[..., Any]) -> ContextManagerKind:
+    func = inspect.unwrap(func)
+    if inspect.isasyncgenfunction(func):
+        return ContextManagerKind.async_
+    if inspect.isgeneratorfunction(func):
+        return ContextManagerKind.sync
+    return ContextManagerKind.none
 
 
 def is_context_manager_function(func: Callable[..., Any]) -> bool:
-    while inner := getattr(func, "__wrapped__", None):
-        func = inner
-    return inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(
-        func,
-    )
+    return get_context_manager_kind(func) is not ContextManagerKind.none
 
 
 async def enter_context_maybe(
@@ -70,7 +82,15 @@ async def enter_context_maybe(
         _T | AbstractContextManager[_T] | AbstractAsyncContextManager[_T]
     ),
     stack: AsyncExitStack,
+    kind: ContextManagerKind | None = None,
 ) -> _T:
+    if kind is ContextManagerKind.async_:
+        return await stack.enter_async_context(
+            resolved,  # type: ignore[arg-type]
+        )
+    if kind is ContextManagerKind.sync:
+        return stack.enter_context(resolved)  # type: ignore[arg-type]
+
     if isinstance(resolved, contextlib.AsyncContextDecorator):
         return await stack.enter_async_context(
             resolved,  # type: ignore[arg-type]
@@ -84,7 +104,11 @@ async def enter_context_maybe(
 def enter_sync_context_maybe(
     resolved: _T | AbstractContextManager[_T],
     stack: ExitStack,
+    kind: ContextManagerKind | None = None,
 ) -> _T:
+    if kind is ContextManagerKind.sync:
+        return stack.enter_context(resolved)  # type: ignore[arg-type]
+
     if isinstance(resolved, contextlib.ContextDecorator):
         return stack.enter_context(resolved)  # type: ignore[arg-type]
     return resolved  # type: ignore[return-value]
@@ -114,11 +138,34 @@ def get_fn_ns(fn: Callable[..., Any]) -> dict[str, Any]:
     return getattr(sys.modules.get(fn.__module__, None), "__dict__", {})
 
 
+def _wrap_nested_forward_refs(annotation: Any) -> Any:
+    # Python 3.10 doesn't evaluate plain strings inside of builtin generic
+    # aliases such as list["T"], wrap them into ForwardRef explicitly
+    if not isinstance(annotation, types.GenericAlias):
+        return annotation
+    # Typed as type | TypeAliasType on 3.12+, GenericAlias accepts both
+    origin: Any = annotation.__origin__
+    args = tuple(
+        typing.ForwardRef(arg) if isinstance(arg, str) else arg
+        for arg in map(_wrap_nested_forward_refs, annotation.__args__)
+    )
+    return types.GenericAlias(origin, args)
+
+
 def get_return_annotation(
-    ret_annotation: str,
+    ret_annotation: Any,
     context: dict[str, Any],
-) -> type[Any]:
-    return eval(ret_annotation, context)  # noqa: S307
+) -> Any:
+    # Resolve a single annotation with get_type_hints semantics, including
+    # string forward references nested inside of it, e.g. Iterator["T"]
+    holder = types.SimpleNamespace(
+        __annotations__={"return": _wrap_nested_forward_refs(ret_annotation)}
+    )
+    return typing.get_type_hints(
+        holder,
+        globalns=context,
+        include_extras=True,
+    )["return"]
 
 
 @functools.cache
@@ -62,6 +62,16 @@ class Container:
         if class_name and class_name not in self.type_context:
             self.type_context[class_name] = provider.type_
 
+    def warmup(self) -> None:
+        """Resolve and cache dependencies of all registered providers.
+
+        Raises NameError if a forward reference used by any provider
+        does not refer to a registered type.
+        """
+        for providers in self.providers.values():
+            for provider in providers:
+                provider.collect_dependencies(context=self.type_context)
+
     def get_provider(self, type_: type[T]) -> Provider[T]:
         return self.get_providers(type_)[0]
 
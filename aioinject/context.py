@@ -18,7 +18,7 @@ from typing import (
 from typing_extensions import Self
 
 from aioinject._features.generics import get_generic_parameter_map
-from aioinject._store import InstanceStore, NotInCache
+from aioinject._store import NOT_IN_CACHE, InstanceStore
 from aioinject._types import AnyCtx, T
 from aioinject.extensions import (
     ContextExtension,
@@ -113,9 +113,12 @@ class InjectionContext(_BaseInjectionContext[ContextExtension]):
         provider: Provider[_T],
     ) -> _T:
         store = self._get_store(provider.lifetime)
-        if (cached := store.get(provider)) is not NotInCache.sentinel:
+        if (cached := store.get(provider)) is not NOT_IN_CACHE:
             return cached
 
+        if provider.is_trivial:
+            return await self._provide_and_store(provider, store, {})
+
         provider_dependencies = provider.collect_dependencies(
             context=self._container.type_context
         )
@@ -151,8 +154,8 @@ class InjectionContext(_BaseInjectionContext[ContextExtension]):
         dependencies: Mapping[str, object],
     ) -> _T:
         provided = await provider.provide(dependencies)
-        if provider.is_generator:
-            provided = await store.enter_context(provided)
+        if kind := provider.context_manager_kind:
+            provided = await store.enter_context(provided, kind)
         store.add(provider, provided)
         await self._on_resolve(provider=provider, instance=provided)
         return provided
@@ -257,9 +260,12 @@ class SyncInjectionContext(_BaseInjectionContext[SyncContextExtension]):
         provider: Provider[_T],
     ) -> _T:
         store = self._get_store(provider.lifetime)
-        if (cached := store.get(provider)) is not NotInCache.sentinel:
+        if (cached := store.get(provider)) is not NOT_IN_CACHE:
             return cached
 
+        if provider.is_trivial:
+            return self._provide_and_store(provider, store, {})
+
         provider_dependencies = provider.collect_dependencies(
             context=self._container.type_context
         )
@@ -295,8 +301,8 @@ class SyncInjectionContext(_BaseInjectionContext[SyncContextExtension]):
         dependencies: Mapping[str, object],
     ) -> _T:
         provided = provider.provide_sync(dependencies)
-        if provider.is_generator:
-            provided = store.enter_sync_context(provided)
+        if kind := provider.context_manager_kind:
+            provided = store.enter_sync_context(provided, kind)
         store.add(provider, provided)
         self._on_resolve(provider=provider, instance=provided)
         return provided
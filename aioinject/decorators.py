@@ -36,7 +36,7 @@ def _wrap_async(
     function: Callable[_P, Coroutine[Any, Any, _T]],
     inject_method: InjectMethod,
 ) -> Callable[_P, Coroutine[Any, Any, _T]]:
-    dependencies = list(collect_dependencies(function))
+    dependencies = collect_dependencies(function)
 
     @functools.wraps(function)
     async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
@@ -78,7 +78,7 @@ def _wrap_sync(
     function: Callable[_P, _T],
     inject_method: InjectMethod,
 ) -> Callable[_P, _T]:
-    dependencies = list(collect_dependencies(function))
+    dependencies = collect_dependencies(function)
 
     @functools.wraps(function)
     def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
@@ -6,9 +6,9 @@ import functools
 import inspect
 import typing
 from collections.abc import Mapping
-from dataclasses import dataclass
-from functools import cached_property
+from dataclasses import dataclass, field
 from inspect import isclass
+from types import MappingProxyType
 from typing import (
     Annotated,
     Any,
@@ -23,12 +23,15 @@ from typing import (
 from typing_extensions import Self
 
 from aioinject._utils import (
+    ContextManagerKind,
     _get_type_hints,
+    get_context_manager_kind,
     get_fn_ns,
     get_return_annotation,
     is_context_manager_function,
     is_iterable_generic_collection,
     remove_annotation,
+    sentinel,
 )
 from aioinject.markers import Inject
 
@@ -36,24 +39,24 @@ from aioinject.markers import Inject
 _T = TypeVar("_T")
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Dependency(Generic[_T]):
     name: str
     type_: type[_T]
+    inner_type: type[_T] = field(init=False, repr=False, compare=False)
+    is_iterable: bool = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
 
-    @cached_property
-    def inner_type(self) -> type[_T]:
-        return typing.cast(
+    def __post_init__(self) -> None:
+        self.is_iterable = is_iterable_generic_collection(self.type_)  # type: ignore[arg-type]
+        self.inner_type = typing.cast(
             type[_T],
             typing.get_args(self.type_)[0] if self.is_iterable else self.type_,
         )
-
-    @cached_property
-    def is_iterable(self) -> bool:
-        return is_iterable_generic_collection(self.type_)  # type: ignore[arg-type]
+        self._hash = hash(self.type_)
 
     def __hash__(self) -> int:
-        return hash(self.type_)
+        return self._hash
 
 
 def _get_annotation_args(type_hint: Any) -> tuple[type, tuple[Any, ...]]:
@@ -68,46 +71,53 @@ def _find_inject_marker_in_annotation_args(
     args: tuple[Any, ...],
 ) -> Inject | None:
     for arg in args:
-        try:
-            if issubclass(arg, Inject):
-                return Inject()
-        except TypeError:
-            pass
-
         if isinstance(arg, Inject):
             return arg
+        if arg is Inject or (isclass(arg) and issubclass(arg, Inject)):
+            return Inject()
     return None
 
 
 def collect_dependencies(
-    dependant: typing.Callable[..., object] | dict[str, Any],
+    dependant: typing.Callable[..., object] | Mapping[str, Any],
     ctx: dict[str, type[Any]] | None = None,
-) -> typing.Iterable[Dependency[object]]:
-    if not isinstance(dependant, dict):
+) -> list[Dependency[object]]:
+    type_hints: Mapping[str, Any]
+    if not isinstance(dependant, Mapping):
         with remove_annotation(dependant.__annotations__, "return"):
             type_hints = _get_type_hints(dependant, context=ctx)
     else:
         type_hints = dependant
+
+    result: list[Dependency[object]] = []
     for name, hint in type_hints.items():
         dep_type, args = _get_annotation_args(hint)
         inject_marker = _find_inject_marker_in_annotation_args(args)
         if inject_marker is None:
             continue
 
-        yield Dependency(
-            name=name,
-            type_=dep_type,
+        result.append(
+            Dependency(
+                name=name,
+                type_=dep_type,
+            )
         )
+    return result
 
 
 def _typevar_map(
     source: type[Any],
 ) -> tuple[type, Mapping[object, object]]:
-    origin = typing.get_origin(source)
-    if not isclass(source) and not origin:  # type: ignore[unreachable]  # It's reachable
+    if not isclass(source) and not typing.get_origin(source):  # type: ignore[unreachable]  # It's reachable
         return source, {}  # type: ignore[unreachable]
+    return _class_typevar_map(source)  # type: ignore[arg-type]
 
-    resolved_source = origin or source
+
+@functools.lru_cache(maxsize=512)
+def _class_typevar_map(
+    source: type[Any],
+) -> tuple[type, Mapping[object, object]]:
+    resolved_source = typing.get_origin(source) or source
     typevar_map: dict[object, object] = {}
     for base in (source, *getattr(source, "__orig_bases__", [])):
         origin = typing.get_origin(base)
@@ -118,7 +128,7 @@ def _typevar_map(
         args = typing.get_args(base)
         typevar_map |= dict(zip(params, args, strict=False))
 
-    return resolved_source, typevar_map
+    return resolved_source, MappingProxyType(typevar_map)
 
 
 def _get_provider_type_hints(
@@ -172,26 +182,25 @@ def _guess_return_type(factory: _FactoryType[_T]) -> type[_T]:  # noqa: C901
     if isclass(factory) or is_generic:
         return typing.cast(type[_T], factory)
 
-    try:
-        return_type = _get_type_hints(unwrapped)["return"]
-    except KeyError as e:
+    # Only the return annotation is resolved, parameters might reference
+    # types from container's context which isn't available here.
+    ret_annotation = getattr(unwrapped, "__annotations__", {}).get(
+        "return",
+        sentinel,
+    )
+    if ret_annotation is sentinel:
         msg = f"Factory {factory.__qualname__} does not specify return type."
+        raise ValueError(msg)
+
+    try:
+        return_type = get_return_annotation(
+            ret_annotation,
+            context=get_fn_ns(unwrapped),
+        )
+    except NameError as e:
+        msg = f"Factory {factory.__qualname__} does not specify return type. Or it's type is not defined yet."
         raise ValueError(msg) from e
-    except NameError:
-        # handle future annotations.
-        # functions might have dependecies in them
-        # and we don't have the container context here so
-        # we can't call _get_type_hints
-        ret_annotation = unwrapped.__annotations__["return"]
 
-        try:
-            return_type = get_return_annotation(
-                ret_annotation,
-                context=get_fn_ns(unwrapped),
-            )
-        except NameError as e:
-            msg = f"Factory {factory.__qualname__} does not specify return type. Or it's type is not defined yet."
-            raise ValueError(msg) from e
     if origin := typing.get_origin(return_type):
         args = typing.get_args(return_type)
 
@@ -222,10 +231,18 @@ class DependencyLifetime(enum.Enum):
 
 @runtime_checkable
 class Provider(Protocol[_T]):
+    __slots__ = ("_cached_dependencies",)
+
     impl: Any
     type_: type[_T]
     lifetime: DependencyLifetime
-    _cached_dependencies: tuple[Dependency[object], ...]
+    is_trivial: ClassVar[bool] = False
+    # Context the dependencies were collected with, it's kept alive and
+    # compared by identity so a new dict can't reuse a stale entry
+    _cached_dependencies: tuple[
+        dict[str, Any] | None,
+        tuple[Dependency[object], ...],
+    ]
 
     async def provide(self, kwargs: Mapping[str, Any]) -> _T: ...
 
@@ -236,14 +253,23 @@ class Provider(Protocol[_T]):
         context: dict[str, Any] | None = None,
     ) -> tuple[Dependency[object], ...]:
         try:
-            return self._cached_dependencies
+            cached_context, dependencies = self._cached_dependencies
         except AttributeError:
-            self._cached_dependencies = tuple(
-                collect_dependencies(self.type_hints(context), ctx=context),
-            )
-            return self._cached_dependencies
+            pass
+        else:
+            if cached_context is context:
+                return dependencies
 
-    def type_hints(self, context: dict[str, Any] | None) -> dict[str, Any]: ...
+        dependencies = tuple(
+            collect_dependencies(self.type_hints(context), ctx=context),
+        )
+        self._cached_dependencies = (context, dependencies)
+        return dependencies
+
+    def type_hints(
+        self,
+        context: dict[str, Any] | None,
+    ) -> Mapping[str, Any]: ...
 
     @property
     def is_async(self) -> bool: ...
@@ -252,12 +278,29 @@ class Provider(Protocol[_T]):
     def is_generator(self) -> bool:
         return is_context_manager_function(self.impl)
 
+    @functools.cached_property
+    def context_manager_kind(self) -> ContextManagerKind:
+        return get_context_manager_kind(self.impl)
+
     def __repr__(self) -> str:  # pragma: no cover
         return f"{self.__class__.__qualname__}(type={self.type_}, implementation={self.impl})"
 
 
 class Scoped(Provider[_T]):
+    __slots__ = (
+        "_static_type_hints",
+        "_type_hints_cache",
+        "context_manager_kind",
+        "impl",
+        "is_async",
+        "is_generator",
+        "type_",
+    )
+
     lifetime = DependencyLifetime.scoped
+    is_async: bool
+    is_generator: bool
+    context_manager_kind: ContextManagerKind
 
     def __init__(
         self,
@@ -266,6 +309,20 @@ class Scoped(Provider[_T]):
     ) -> None:
         self.impl = factory
         self.type_ = type_ or _guess_return_type(factory)
+        self.is_async = inspect.iscoroutinefunction(factory)
+        self.context_manager_kind = get_context_manager_kind(factory)
+        self.is_generator = (
+            self.context_manager_kind is not ContextManagerKind.none
+        )
+        self._type_hints_cache: (
+            tuple[dict[str, Any] | None, Mapping[str, Any]] | None
+        ) = None
+        self._static_type_hints: Mapping[str, Any] | None
+        try:
+            self._static_type_hints = self._get_type_hints(context=None)
+        except (NameError, TypeError):
+            # Might depend on forward references from container's type context
+            self._static_type_hints = None
 
     def provide_sync(self, kwargs: Mapping[str, Any]) -> _T:
         return self.impl(**kwargs)  # type: ignore[return-value]
@@ -279,28 +336,53 @@ class Scoped(Provider[_T]):
     def type_hints(
         self,
         context: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+    ) -> Mapping[str, Any]:
+        # Container's type context takes precedence over module globals,
+        # hints resolved at construction are only valid without it
+        if context is None and self._static_type_hints is not None:
+            return self._static_type_hints
+
+        if (
+            self._type_hints_cache is not None
+            and self._type_hints_cache[0] is context
+        ):
+            return self._type_hints_cache[1]
+
+        type_hints = self._get_type_hints(context=context)
+        self._type_hints_cache = (context, type_hints)
+        return type_hints
+
+    def _get_type_hints(
+        self,
+        context: dict[str, Any] | None,
+    ) -> Mapping[str, Any]:
         type_hints = _get_provider_type_hints(self, context=context)
         if "return" in type_hints:
             del type_hints["return"]
-        return type_hints
-
-    @functools.cached_property
-    def is_async(self) -> bool:
-        return inspect.iscoroutinefunction(self.impl)
+        # Shared between callers through the caches
+        return MappingProxyType(type_hints)
 
 
 class Singleton(Scoped[_T]):
+    __slots__ = ()
+
     lifetime = DependencyLifetime.singleton
 
 
 class Transient(Scoped[_T]):
+    __slots__ = ()
+
     lifetime = DependencyLifetime.transient
 
 
 class Object(Provider[_T]):
-    _type_hints: ClassVar[dict[str, Any]] = {}
+    __slots__ = ("impl", "type_")
+
+    _type_hints: ClassVar[Mapping[str, Any]] = MappingProxyType({})
     is_async = False
+    is_generator = False
+    context_manager_kind = ContextManagerKind.none
+    is_trivial = True
     impl: _T
     lifetime = DependencyLifetime.scoped  # It's ok to cache it
 
@@ -318,5 +400,14 @@ class Object(Provider[_T]):
     async def provide(self, kwargs: Mapping[str, Any]) -> _T:  # noqa: ARG002
         return self.impl
 
-    def type_hints(self, _: dict[str, Any] | None = None) -> dict[str, Any]:
+    def collect_dependencies(
+        self,
+        context: dict[str, Any] | None = None,  # noqa: ARG002
+    ) -> tuple[Dependency[object], ...]:
+        return ()
+
+    def type_hints(
+        self,
+        _: dict[str, Any] | None = None,
+    ) -> Mapping[str, Any]:
         return self._type_hints
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import aioinject
+
+
+class Service:
+    # "Repository" isn't a global of this module, it's only resolvable
+    # through the container's type context
+    def __init__(self, repository: Repository) -> None:  # type: ignore[name-defined] # noqa: F821
+        self.repository = repository
+
+
+def create_container() -> aioinject.Container:
+    class Repository:
+        pass
+
+    container = aioinject.Container()
+    container.register(aioinject.Scoped(Service))
+    container.register(aioinject.Scoped(Repository))
+
+    # Collects dependencies of every registered provider upfront,
+    # without the registration above it would raise NameError
+    container.warmup()
+    return container
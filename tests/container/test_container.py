@@ -1,5 +1,6 @@
 import contextlib
 from collections.abc import AsyncIterator, Iterator
+from unittest.mock import patch
 
 import pytest
 from pydantic_settings import BaseSettings
@@ -7,6 +8,7 @@ from pydantic_settings import BaseSettings
 from aioinject import Object, Scoped, Singleton, providers
 from aioinject.containers import Container
 from aioinject.context import InjectionContext
+from aioinject.providers import Dependency
 
 
 class _AbstractService:
@@ -73,6 +75,33 @@ def test_cant_register_multiple_providers_for_same_type(
         container.register(Scoped(int))
 
 
+def test_warmup(container: Container) -> None:
+    class _Local:
+        pass
+
+    class _Dependant:
+        def __init__(self, local: "_Local") -> None:
+            pass
+
+    container.register(Scoped(_Dependant))
+    with pytest.raises(NameError):
+        container.warmup()
+
+    container.register(Scoped(_Local))
+    container.warmup()
+    with patch.object(
+        providers,
+        "_get_provider_type_hints",
+        wraps=providers._get_provider_type_hints,  # noqa: SLF001
+    ) as type_hints_mock:
+        assert container.get_provider(_Dependant).collect_dependencies(
+            container.type_context
+        ) == (Dependency(name="local", type_=_Local),)
+        with container.sync_context() as ctx:
+            assert isinstance(ctx.resolve(_Dependant), _Dependant)
+    type_hints_mock.assert_not_called()
+
+
 def test_can_try_register(container: Container) -> None:
     def same_impl() -> _ServiceA:
         return _ServiceA()
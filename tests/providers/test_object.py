@@ -1,8 +1,11 @@
+import contextlib
+from collections.abc import Iterator
 from typing import Annotated, Any
 
 import pytest
 
 from aioinject import Inject, Object
+from aioinject._utils import ContextManagerKind
 
 
 async def test_would_provide_same_object() -> None:
@@ -53,3 +56,16 @@ def test_should_not_be_async(
     for obj in dependencies_test_data:
         provider = Object(object_=obj)
         assert provider.is_async is False
+
+
+def test_should_not_be_context_manager(
+    dependencies_test_data: tuple[Any, ...],
+) -> None:
+    @contextlib.contextmanager
+    def ctx() -> Iterator[int]:
+        yield 0
+
+    for obj in (*dependencies_test_data, ctx, {}):
+        provider = Object(object_=obj)
+        assert provider.is_generator is False
+        assert provider.context_manager_kind is ContextManagerKind.none
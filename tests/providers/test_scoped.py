@@ -1,10 +1,11 @@
+import contextlib
 from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
 from typing import Annotated, Any
 from unittest.mock import patch
 
 import pytest
 
-from aioinject import Inject, Provider, providers
+from aioinject import Container, Inject, Provider, providers
 from aioinject.providers import Dependency
 
 
@@ -87,6 +88,75 @@ def test_annotated_type_hint() -> None:
     }
 
 
+def test_type_hints_are_resolved_once() -> None:
+    def factory(a: int) -> None:
+        pass
+
+    provider = providers.Scoped(factory)
+    context: dict[str, Any] = {}
+    assert provider.type_hints() is provider.type_hints()
+    assert provider.type_hints(context) is provider.type_hints(context)
+
+
+def test_type_hints_are_read_only() -> None:
+    def factory(a: int) -> None:
+        pass
+
+    provider = providers.Scoped(factory)
+    with pytest.raises(TypeError):
+        provider.type_hints()["a"] = str  # type: ignore[index]
+
+
+class _Shadowed:
+    pass
+
+
+def test_type_context_takes_precedence_over_module_globals() -> None:
+    def factory(a: "_Shadowed") -> None:
+        pass
+
+    provider = providers.Scoped(factory)
+    assert provider.type_hints() == {"a": Annotated[_Shadowed, Inject]}
+    assert provider.collect_dependencies({"_Shadowed": int}) == (
+        Dependency(name="a", type_=int),
+    )
+
+
+def test_type_hints_with_forward_refs_are_cached_for_context() -> None:
+    class Test:
+        def __init__(self, a: "_Deferred") -> None:  # type: ignore[name-defined] # noqa: F821
+            pass
+
+    provider = providers.Scoped(Test)
+    with pytest.raises(NameError):
+        provider.type_hints()
+
+    context: dict[str, Any] = {"_Deferred": int}
+    assert provider.type_hints(context) == {"a": Annotated[int, Inject]}
+    assert provider.type_hints(context) is provider.type_hints(context)
+    assert provider.type_hints(context) is not provider.type_hints(
+        dict(context)
+    )
+
+
+@pytest.mark.parametrize("type_", [str, bytes, float])
+def test_type_hints_are_not_reused_for_freed_contexts(type_: type) -> None:
+    class Test:
+        def __init__(self, a: "_Deferred") -> None:  # type: ignore[name-defined] # noqa: F821
+            pass
+
+    provider = providers.Scoped(Test)
+    for context_type in (int, type_):
+        context: dict[str, Any] = {"_Deferred": context_type}
+        assert provider.type_hints(context) == {
+            "a": Annotated[context_type, Inject]
+        }
+        assert provider.collect_dependencies(context) == (
+            Dependency(name="a", type_=context_type),
+        )
+        del context
+
+
 def test_is_async_on_sync() -> None:
     def factory() -> None:
         pass
@@ -160,3 +230,34 @@ async def async_gen() -> AsyncGenerator[int, None]:
 def test_generator_return_types(factory: Any) -> None:
     provider = providers.Scoped(factory)
     assert provider.type_ is int
+
+
+def forward_ref_iterable() -> Iterator["_Test"]:
+    yield _Test()
+
+
+def forward_ref_list() -> list["_Test"]:
+    return [_Test()]
+
+
+@pytest.mark.parametrize(
+    ("factory", "expected"),
+    [
+        (forward_ref_iterable, _Test),
+        (forward_ref_list, list[_Test]),
+    ],
+)
+def test_nested_forward_ref_return_types(
+    factory: Any,
+    expected: object,
+) -> None:
+    assert providers.Scoped(factory).type_ == expected
+
+
+async def test_resolve_nested_forward_ref_context_manager() -> None:
+    container = Container()
+    container.register(
+        providers.Scoped(contextlib.contextmanager(forward_ref_iterable))
+    )
+    async with container.context() as ctx:
+        assert isinstance(await ctx.resolve(_Test), _Test)
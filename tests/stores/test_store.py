@@ -75,3 +75,17 @@ async def test_lock(store_cls: type[InstanceStore]) -> None:
 
     with store.sync_lock(provider) as should_provide:
         assert should_provide is False
+
+
+def test_singleton_store_creates_exit_stacks_eagerly() -> None:
+    store = SingletonStore()
+    exit_stack, sync_exit_stack = store._exit_stack, store._sync_exit_stack  # noqa: SLF001
+    assert exit_stack is not None
+    assert sync_exit_stack is not None
+
+    @contextlib.contextmanager
+    def ctx() -> Iterator[int]:
+        yield _NUMBER
+
+    store.enter_sync_context(ctx())
+    assert store._sync_exit_stack is sync_exit_stack  # noqa: SLF001
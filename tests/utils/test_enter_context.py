@@ -1,8 +1,17 @@
 import contextlib
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import AsyncExitStack, ExitStack
+from typing import Any
 
-from aioinject._utils import enter_context_maybe, enter_sync_context_maybe
+import pytest
+
+from aioinject._utils import (
+    ContextManagerKind,
+    enter_context_maybe,
+    enter_sync_context_maybe,
+    get_context_manager_kind,
+    is_context_manager_function,
+)
 
 
 _NUMBER = 42
@@ -24,3 +33,40 @@ async def test_enter_context_maybe() -> None:
 
     for item in (_ctx(), _NUMBER):
         assert enter_sync_context_maybe(item, ExitStack()) == _NUMBER
+
+
+async def test_enter_context_maybe_with_kind() -> None:
+    for item, kind in (
+        (_async_ctx(), ContextManagerKind.async_),
+        (_ctx(), ContextManagerKind.sync),
+        (_NUMBER, ContextManagerKind.none),
+    ):
+        assert (
+            await enter_context_maybe(item, AsyncExitStack(), kind) == _NUMBER
+        )
+
+    for item, kind in (
+        (_ctx(), ContextManagerKind.sync),
+        (_NUMBER, ContextManagerKind.none),
+    ):
+        assert enter_sync_context_maybe(item, ExitStack(), kind) == _NUMBER
+
+
+def _plain() -> int:
+    return _NUMBER
+
+
+@pytest.mark.parametrize(
+    ("function", "expected"),
+    [
+        (_async_ctx, ContextManagerKind.async_),
+        (_ctx, ContextManagerKind.sync),
+        (_plain, ContextManagerKind.none),
+    ],
+)
+def test_get_context_manager_kind(
+    function: Callable[..., Any],
+    expected: ContextManagerKind,
+) -> None:
+    assert get_context_manager_kind(function) is expected
+    assert is_context_manager_function(function) is bool(expected)
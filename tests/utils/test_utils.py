@@ -1,7 +1,8 @@
+import inspect
 from typing import Annotated
 
 from aioinject import Inject
-from aioinject._utils import get_inject_annotations
+from aioinject._utils import clear_wrapper, get_inject_annotations
 
 
 def test_inject_annotations_returns_all_inject_markers() -> None:
@@ -16,3 +17,17 @@ def test_inject_annotations_returns_all_inject_markers() -> None:
         "b": Annotated[int, Inject],
         "c": Annotated[int, Inject()],
     }
+
+
+def test_clear_wrapper_is_idempotent() -> None:
+    def func(
+        a: int,
+        b: Annotated[int, Inject],
+    ) -> None:
+        pass
+
+    clear_wrapper(func)
+    assert get_inject_annotations(func) == {}
+
+    clear_wrapper(func)
+    assert list(inspect.signature(func).parameters) == ["a"]